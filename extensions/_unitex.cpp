@@ -44,7 +44,11 @@ PyObject *unitex_tool(PyObject *self, PyObject *args) {
         return NULL;
 
     unsigned int ret;
+    /* The command string belongs to the arguments tuple which is kept
+     * alive during the call: the GIL can be released. */
+    Py_BEGIN_ALLOW_THREADS
     ret = UnitexTool_public_run_string(command);
+    Py_END_ALLOW_THREADS
 
     return Py_BuildValue("O", ret ? Py_False: Py_True);
 }
@@ -415,6 +419,54 @@ PyObject *unitex_rm(PyObject *self, PyObject *args) {
     return Py_BuildValue("O", ret ? Py_False: Py_True);
 }
 
+/* 'unitex_rm_many' function */
+static char unitex_rm_many_docstring[] = "\
+This function removes a list of files in a single call. The pathes\n\
+can be on the virtual filesystem or the disk filesystem.\n\n\
+*Positional arguments (length: 1):*\n\n\
+- **0 [list(str)]** -- the file pathes.\n\n\
+*Return [list(bool)]:*\n\n\
+  For each path, **True** if the removal succeeds, **False** otherwise.\
+";
+static PyObject *unitex_rm_many(PyObject *self, PyObject *args);
+
+PyObject *unitex_rm_many(PyObject *self, PyObject *args) {
+    PyObject *paths;
+    if (!PyArg_ParseTuple(args, "O", &paths))
+        return NULL;
+
+    PyObject *sequence = PySequence_Fast(paths, "The file pathes must be a sequence.");
+    if (sequence == NULL)
+        return NULL;
+
+    Py_ssize_t size = PySequence_Fast_GET_SIZE(sequence);
+
+    PyObject *results = PyList_New(size);
+    if (results == NULL) {
+        Py_DECREF(sequence);
+        return NULL;
+    }
+
+    for (Py_ssize_t i = 0; i != size; ++i) {
+        char *path;
+        if (!PyArg_Parse(PySequence_Fast_GET_ITEM(sequence, i), "s", &path)) {
+            Py_DECREF(results);
+            Py_DECREF(sequence);
+            return NULL;
+        }
+
+        unsigned int ret;
+        ret = RemoveUnitexFile(path);
+
+        PyObject *result = ret ? Py_False: Py_True;
+        Py_INCREF(result);
+        PyList_SET_ITEM(results, i, result);
+    }
+    Py_DECREF(sequence);
+
+    return results;
+}
+
 /* 'unitex_mv' function */
 static char unitex_mv_docstring[] = "\
 This function moves/renames a file. Both pathes can be on the\n\
@@ -552,13 +604,8 @@ PyObject *unitex_read_file(PyObject *self, PyObject *args) {
         }
     }
 
-    char* _content = (char*)malloc(file_size+1);
-    memcpy(_content, bufchar+bom_size, file_size-bom_size);
-
-    *(_content+file_size-bom_size) = '\0';
-
-    content = PyUnicode_FromString(_content);
-    free(_content);
+    /* The content is decoded directly from the file buffer. */
+    content = PyUnicode_DecodeUTF8((const char*)(bufchar+bom_size), file_size-bom_size, "strict");
 
     CloseUnitexFileReadBuffer(amf, buffer, file_size);
 
@@ -596,20 +643,153 @@ PyObject *unitex_read_binary_file(PyObject *self, PyObject *args) {
         }
     }
 
-    char* _content = (char*)malloc(file_size+1);
-    memcpy(_content, bufchar+bom_size, file_size-bom_size);
-
-    *(_content+file_size-bom_size) = '\0';
-
     /* y# doesn't seem to work in ptyhon 2.X */
-    //content = Py_BuildValue("y#", _content, file_size);
-    content = Py_BuildValue("s#", _content, file_size);
+    //content = Py_BuildValue("y#", (const char*)(bufchar+bom_size), file_size-bom_size);
+    content = Py_BuildValue("s#", (const char*)(bufchar+bom_size), (int)(file_size-bom_size));
 
     CloseUnitexFileReadBuffer(amf, buffer, file_size);
 
     return content;
 }
 
+/* Line reader used by the 'unitex_open_read', 'unitex_readline' and
+ * 'unitex_close_read' functions. */
+struct unitex_reader {
+    UNITEXFILEMAPPED *amf;
+    const void *buffer;
+    size_t file_size;
+    size_t position;
+};
+
+static const char *unitex_reader_name = "_unitex.reader";
+
+static void unitex_reader_close(struct unitex_reader *reader) {
+    if (reader->amf != NULL) {
+        CloseUnitexFileReadBuffer(reader->amf, reader->buffer, reader->file_size);
+    }
+    reader->amf = NULL;
+    reader->buffer = NULL;
+    reader->file_size = 0;
+    reader->position = 0;
+}
+
+static void unitex_reader_destructor(PyObject *capsule) {
+    struct unitex_reader *reader = (struct unitex_reader *)PyCapsule_GetPointer(capsule, unitex_reader_name);
+    if (reader == NULL)
+        return;
+
+    unitex_reader_close(reader);
+    free(reader);
+}
+
+/* 'unitex_open_read' function (UTF-8 encoding only)*/
+static char unitex_open_read_docstring[] = "\
+This function opens a file from the disk or from the virtual filesystem\n\
+in order to read it line by line with the 'unitex_readline' function.\n\
+**WARNING: The file must be encoded in UTF-8.**\n\n\
+*Positional arguments (length: 1):*\n\n\
+- **0 [str]** -- the file path.\n\n\
+*Return [capsule]:*\n\n\
+  The function returns an opaque handle which must be released with\n\
+  the 'unitex_close_read' function.\
+";
+static PyObject *unitex_open_read(PyObject *self, PyObject *args);
+
+PyObject *unitex_open_read(PyObject *self, PyObject *args) {
+    char *path;
+    if (!PyArg_ParseTuple(args, "s", &path))
+        return NULL;
+
+    struct unitex_reader *reader = (struct unitex_reader *)malloc(sizeof(struct unitex_reader));
+    if (reader == NULL)
+        return PyErr_NoMemory();
+
+    reader->amf = NULL;
+    reader->buffer = NULL;
+    reader->file_size = 0;
+    reader->position = 0;
+
+    GetUnitexFileReadBuffer(path, &(reader->amf), &(reader->buffer), &(reader->file_size));
+    if (reader->amf == NULL) {
+        free(reader);
+        return PyErr_Format(PyExc_IOError, "Unable to open file '%s'.", path);
+    }
+
+    const unsigned char* bufchar = (const unsigned char*)reader->buffer;
+    if (reader->file_size>2) {
+        if (((*(bufchar))==0xef) && ((*(bufchar+1))==0xbb) && ((*(bufchar+2))==0xbf)) {
+            reader->position = 3;
+        }
+    }
+
+    PyObject *handle = PyCapsule_New(reader, unitex_reader_name, unitex_reader_destructor);
+    if (handle == NULL) {
+        unitex_reader_close(reader);
+        free(reader);
+    }
+
+    return handle;
+}
+
+/* 'unitex_readline' function (UTF-8 encoding only)*/
+static char unitex_readline_docstring[] = "\
+This function reads the next line of a file opened with the\n\
+'unitex_open_read' function.\n\n\
+*Positional arguments (length: 1):*\n\n\
+- **0 [capsule]** -- the handle returned by 'unitex_open_read'.\n\n\
+*Return [str]:*\n\n\
+  The function returns the line (including the end of line character)\n\
+  as an unicode string or None at the end of the file.\
+";
+static PyObject *unitex_readline(PyObject *self, PyObject *args);
+
+PyObject *unitex_readline(PyObject *self, PyObject *args) {
+    PyObject *handle;
+    if (!PyArg_ParseTuple(args, "O", &handle))
+        return NULL;
+
+    struct unitex_reader *reader = (struct unitex_reader *)PyCapsule_GetPointer(handle, unitex_reader_name);
+    if (reader == NULL)
+        return NULL;
+
+    if (reader->amf == NULL || reader->position >= reader->file_size)
+        Py_RETURN_NONE;
+
+    const char *start = (const char*)reader->buffer + reader->position;
+    size_t left = reader->file_size - reader->position;
+
+    const char *end = (const char*)memchr(start, '\n', left);
+    size_t length = (end == NULL) ? left : (size_t)(end - start) + 1;
+
+    reader->position += length;
+
+    return PyUnicode_DecodeUTF8(start, length, "strict");
+}
+
+/* 'unitex_close_read' function */
+static char unitex_close_read_docstring[] = "\
+This function closes a file opened with the 'unitex_open_read' function.\n\n\
+*Positional arguments (length: 1):*\n\n\
+- **0 [capsule]** -- the handle returned by 'unitex_open_read'.\n\n\
+*Return [bool]:*\n\n\
+  **True** if the function succeeds, **False** otherwise.\
+";
+static PyObject *unitex_close_read(PyObject *self, PyObject *args);
+
+PyObject *unitex_close_read(PyObject *self, PyObject *args) {
+    PyObject *handle;
+    if (!PyArg_ParseTuple(args, "O", &handle))
+        return NULL;
+
+    struct unitex_reader *reader = (struct unitex_reader *)PyCapsule_GetPointer(handle, unitex_reader_name);
+    if (reader == NULL)
+        return NULL;
+
+    unitex_reader_close(reader);
+
+    return Py_BuildValue("O", Py_True);
+}
+
 /* 'unitex_write_file' function (UTF-8 encoding only)*/
 static char unitex_write_file_docstring[] = "\
 This function writes a file on the disk or on the virtual filesystem.\n\
@@ -703,6 +883,7 @@ static PyMethodDef unitex_methods[] = {
 
     {"unitex_cp", unitex_cp, METH_VARARGS, unitex_cp_docstring},
     {"unitex_rm", unitex_rm, METH_VARARGS, unitex_rm_docstring},
+    {"unitex_rm_many", unitex_rm_many, METH_VARARGS, unitex_rm_many_docstring},
     {"unitex_mv", unitex_mv, METH_VARARGS, unitex_mv_docstring},
     {"unitex_mkdir", unitex_mkdir, METH_VARARGS, unitex_mkdir_docstring},
     {"unitex_rmdir", unitex_rmdir, METH_VARARGS, unitex_rmdir_docstring},
@@ -710,6 +891,9 @@ static PyMethodDef unitex_methods[] = {
 
     {"unitex_read_file", unitex_read_file, METH_VARARGS, unitex_read_file_docstring},
     {"unitex_read_binary_file", unitex_read_binary_file, METH_VARARGS, unitex_read_binary_file_docstring},
+    {"unitex_open_read", unitex_open_read, METH_VARARGS, unitex_open_read_docstring},
+    {"unitex_readline", unitex_readline, METH_VARARGS, unitex_readline_docstring},
+    {"unitex_close_read", unitex_close_read, METH_VARARGS, unitex_close_read_docstring},
     {"unitex_write_file", unitex_write_file, METH_VARARGS, unitex_write_file_docstring},
     {"unitex_append_to_file", unitex_append_to_file, METH_VARARGS, unitex_append_to_file_docstring},
 
@@ -133,6 +133,21 @@ class TestUnitexIO(unittest.TestCase):
 
         self.assertTrue(ok, "Remove from disk failed!")
 
+    def test_07_03_rm_many_vfs(self):
+        cp(self._arguments["file_source"], self._arguments["file_target_vfs_01"])
+        cp(self._arguments["file_source"], self._arguments["file_target_vfs_02"])
+
+        ret = rm_many([self._arguments["file_target_vfs_01"], self._arguments["file_target_vfs_02"]])
+
+        # Note that this check needs the 'ls' function working...
+        vfs_content = ls(self._arguments["vfs_root"])
+
+        ok = ret == [True, True]
+        ok = ok and not self._arguments["file_target_vfs_01"] in vfs_content
+        ok = ok and not self._arguments["file_target_vfs_02"] in vfs_content
+
+        self.assertTrue(ok, "Batch remove from VFS failed!")
+
     def test_08_mkdir(self):
         ret = mkdir(self._arguments["directory"])
 
@@ -165,6 +180,17 @@ class TestUnitexIO(unittest.TestCase):
 
         self.assertTrue(ok, "Listing VFS directory failed!")
 
+    def test_10_exists_vfs(self):
+        ok = not exists(self._arguments["unitex_file_vfs"])
+
+        cp(self._arguments["file_source"], self._arguments["unitex_file_vfs"])
+        ok = ok and exists(self._arguments["unitex_file_vfs"])
+
+        rm(self._arguments["unitex_file_vfs"])
+        ok = ok and not exists(self._arguments["unitex_file_vfs"])
+
+        self.assertTrue(ok, "Checking VFS file existence failed!")
+
     def test_11_01_01_unitex_file_read_hdd(self):
         original = None
         with open(self._arguments["file_source"], "r", encoding="utf-8") as rf:
@@ -197,6 +223,24 @@ class TestUnitexIO(unittest.TestCase):
 
         self.assertTrue(ok, "UnitexFile VFS read failed!")
 
+    def test_11_01_03_unitex_file_iter_vfs(self):
+        original = None
+        with open(self._arguments["file_source"], "r", encoding="utf-8") as rf:
+            original = rf.readlines()
+
+        ret = cp(self._arguments["file_source"], self._arguments["unitex_file_vfs"])
+
+        uf = UnitexFile()
+        uf.open(self._arguments["unitex_file_vfs"], "r")
+        lines = [line for line in uf]
+        uf.close()
+
+        ret = rm(self._arguments["unitex_file_vfs"])
+
+        ok = original == lines
+
+        self.assertTrue(ok, "UnitexFile VFS line iteration failed!")
+
     def test_11_02_01_unitex_file_write_hdd(self):
         original = None
         with open(self._arguments["file_source"], "r", encoding="utf-8") as rf:
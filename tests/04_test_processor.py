@@ -6,10 +6,11 @@ import shutil
 import unittest
 import yaml
 
-from unitex import UnitexConstants
+from unitex import UnitexConstants, UnitexException
 from unitex.config import UnitexConfig
+from unitex.io import UnitexFile
 from unitex.tools import compress, grf2fst2
-from unitex.processor import UnitexProcessor
+from unitex.processor import UnitexProcessor, _PERSIST_CACHE
 
 
 
@@ -33,6 +34,17 @@ class Arguments:
         self.__arguments["tag"] = "data/corpus.tag"
         self.__arguments["xml"] = "data/corpus.xml"
 
+        self.__arguments["txt-01"] = "data/corpus-01.txt"
+        self.__arguments["tag-01"] = "data/corpus-01.tag"
+        self.__arguments["ref-01"] = "data/corpus-01.ref"
+        self.__arguments["txt-02"] = "data/corpus-02.txt"
+        self.__arguments["tag-02"] = "data/corpus-02.tag"
+        self.__arguments["ref-02"] = "data/corpus-02.ref"
+        self.__arguments["missing"] = "data/missing.txt"
+        self.__arguments["xml-01"] = "data/corpus-01.xml"
+
+        self.__arguments["ind"] = "data/corpus_snt/concord.ind"
+
     def __getitem__(self, key):
         if key not in self.__arguments:
             raise KeyError("Argument '%s' not found ..." % key)
@@ -72,6 +84,13 @@ class TestUnitexIO(unittest.TestCase):
 
         ret = grf2fst2(grammar, alphabet, **kwargs)
 
+        # Two distinct corpora (the second one is the first sentence of
+        # the first one) to check the 'open_many' results order.
+        shutil.copy(self._arguments["txt"], self._arguments["txt-01"])
+        with open(self._arguments["txt"], "rb") as source:
+            with open(self._arguments["txt-02"], "wb") as target:
+                target.write(source.readline())
+
     @classmethod
     def tearDownClass(self):
         if os.path.exists(self._arguments["bin"]):
@@ -89,6 +108,10 @@ class TestUnitexIO(unittest.TestCase):
         if os.path.exists(self._arguments["xml"]):
             os.remove(self._arguments["xml"])
 
+        for key in ("txt-01", "tag-01", "ref-01", "txt-02", "tag-02", "ref-02"):
+            if os.path.exists(self._arguments[key]):
+                os.remove(self._arguments[key])
+
     def test_01_processor_txt(self):
         options = None
         with open(self._arguments["config"], "r") as f:
@@ -128,6 +151,239 @@ class TestUnitexIO(unittest.TestCase):
         self.assertTrue(ret, "Tagging process failed (xml format)!")
 
 
+    def test_03_processor_context(self):
+        options = None
+        with open(self._arguments["config"], "r") as f:
+            options = yaml.load(f)
+
+        config = UnitexConfig()
+        config.load(options)
+
+        kwargs = {}
+        kwargs["xml"] = False
+
+        with UnitexProcessor(config) as processor:
+            processor.open(self._arguments["txt"], mode="srtlf", tagged=False)
+            ret = processor.tag(self._arguments["fst2"], self._arguments["tag"], **kwargs)
+
+        self.assertTrue(ret, "Tagging process failed (context manager)!")
+
+    def test_04_processor_persistence(self):
+        configs = []
+        for i in range(4):
+            options = None
+            with open(self._arguments["config"], "r") as f:
+                options = yaml.load(f)
+
+            config = UnitexConfig()
+            config.load(options)
+            configs.append(config)
+
+        key = (UnitexConstants.RESOURCE_DICTIONARY, os.path.abspath(self._arguments["bin"]))
+
+        processor_a = UnitexProcessor(configs[0])
+        processor_b = UnitexProcessor(configs[1])
+
+        self.assertEqual(_PERSIST_CACHE[key][1], 2, "Shared resource not reference counted!")
+        self.assertEqual(configs[0]["resources"]["dictionaries"], configs[1]["resources"]["dictionaries"],
+                         "Shared resource loaded twice!")
+
+        # A modified resource is not reloaded while it is still used.
+        mtime = os.path.getmtime(self._arguments["bin"])
+        os.utime(self._arguments["bin"], (mtime + 10, mtime + 10))
+
+        processor_c = UnitexProcessor(configs[2])
+
+        self.assertEqual(_PERSIST_CACHE[key][1], 3, "Modified resource reloaded while in use!")
+        self.assertEqual(configs[0]["resources"]["dictionaries"], configs[2]["resources"]["dictionaries"],
+                         "Modified resource reloaded while in use!")
+
+        processor_a.close(clean=False, free=True)
+        self.assertEqual(_PERSIST_CACHE[key][1], 2, "Resource released by the wrong processor!")
+
+        processor_b.close(clean=False, free=True)
+        self.assertEqual(_PERSIST_CACHE[key][1], 1, "Resource released by the wrong processor!")
+
+        processor_c.close(clean=False, free=True)
+        self.assertFalse(key in _PERSIST_CACHE, "Resource not freed by its last processor!")
+
+        # Once freed, the modified resource is reloaded.
+        processor_d = UnitexProcessor(configs[3])
+
+        self.assertEqual(_PERSIST_CACHE[key][1], 1, "Modified resource not reloaded!")
+        self.assertEqual(_PERSIST_CACHE[key][2], mtime + 10, "Modified resource not reloaded!")
+
+        processor_d.close(clean=False, free=True)
+        self.assertFalse(key in _PERSIST_CACHE, "Resource not freed by its last processor!")
+
+    def test_05_processor_open_many(self):
+        options = None
+        with open(self._arguments["config"], "r") as f:
+            options = yaml.load(f)
+
+        config = UnitexConfig()
+        config.load(options)
+
+        kwargs = {}
+        kwargs["xml"] = False
+
+        paths = [self._arguments["txt-01"], self._arguments["txt-02"]]
+        outputs = [self._arguments["tag-01"], self._arguments["tag-02"]]
+        references = [self._arguments["ref-01"], self._arguments["ref-02"]]
+
+        with UnitexProcessor(config) as processor:
+            for path, reference in zip(paths, references):
+                processor.open(path, mode="srtlf", tagged=False)
+                processor.tag(self._arguments["fst2"], reference, **kwargs)
+                processor.close(clean=True, free=False)
+
+            processors = processor.open_many(paths, mode="srtlf", tagged=False)
+            self.assertEqual(len(processors), len(paths), "Wrong number of opened texts!")
+
+            for _processor, output in zip(processors, outputs):
+                ret = _processor.tag(self._arguments["fst2"], output, **kwargs)
+                _processor.close(clean=True, free=True)
+
+                self.assertTrue(ret, "Tagging process failed (open_many)!")
+
+        for output, reference in zip(outputs, references):
+            with open(output, "rb") as f1, open(reference, "rb") as f2:
+                self.assertEqual(f1.read(), f2.read(), "Opened texts are not in the input order!")
+
+    def test_06_processor_open_many_error(self):
+        options = None
+        with open(self._arguments["config"], "r") as f:
+            options = yaml.load(f)
+
+        config = UnitexConfig()
+        config.load(options)
+
+        key = (UnitexConstants.RESOURCE_DICTIONARY, os.path.abspath(self._arguments["bin"]))
+
+        paths = [self._arguments["txt-01"], self._arguments["missing"]]
+
+        with UnitexProcessor(config) as processor:
+            with self.assertRaises(UnitexException):
+                processor.open_many(paths, mode="srtlf", tagged=False)
+
+            self.assertEqual(_PERSIST_CACHE[key][1], 1, "Resources not released by the failed processors!")
+
+            # The texts sharing their working files are rejected before
+            # being opened.
+            for _paths in ([self._arguments["txt-01"], self._arguments["txt-01"]],
+                           [self._arguments["txt-01"], self._arguments["xml-01"]]):
+                with self.assertRaises(UnitexException):
+                    processor.open_many(_paths, mode="srtlf", tagged=False)
+
+                self.assertEqual(_PERSIST_CACHE[key][1], 1, "Resources loaded for the rejected texts!")
+
+        for path in paths:
+            directory, filename = os.path.split(path)
+            name, extension = os.path.splitext(filename)
+
+            self.assertFalse(os.path.exists(os.path.join(directory, "%s_snt" % name)),
+                             "Working directory not cleaned after a failed open!")
+            self.assertFalse(os.path.exists(os.path.join(directory, "%s.snt" % name)),
+                             "Normalized text not cleaned after a failed open!")
+
+    def test_07_processor_tofst(self):
+        options = None
+        with open(self._arguments["config"], "r") as f:
+            options = yaml.load(f)
+
+        config = UnitexConfig()
+        config.load(options)
+
+        with UnitexProcessor(config) as processor:
+            processor.open(self._arguments["txt"], mode="srtlf", tagged=False)
+
+            fst = processor.tofst()
+            self.assertTrue(processor.tofst() is fst, "Text automaton built twice!")
+
+            processor.close(clean=True, free=False)
+            processor.open(self._arguments["txt"], mode="srtlf", tagged=False)
+
+            self.assertFalse(processor.tofst() is fst, "Text automaton not rebuilt after reopening!")
+
+    def test_08_processor_iter_interleaved(self):
+        options = None
+        with open(self._arguments["config"], "r") as f:
+            options = yaml.load(f)
+
+        config = UnitexConfig()
+        config.load(options)
+
+        kwargs = {}
+        kwargs["xml"] = False
+
+        with UnitexProcessor(config) as processor:
+            processor.open(self._arguments["txt"], mode="srtlf", tagged=False)
+
+            matches = processor.iter(self._arguments["fst2"])
+            next(matches)
+
+            # The index read by the first iterator can't be rewritten or
+            # removed.
+            with self.assertRaises(UnitexException):
+                next(processor.iter(self._arguments["fst2"]))
+            with self.assertRaises(UnitexException):
+                processor.tag(self._arguments["fst2"], self._arguments["tag"], **kwargs)
+            with self.assertRaises(UnitexException):
+                processor.close(clean=True, free=False)
+
+            matches.close()
+
+            ret = processor.tag(self._arguments["fst2"], self._arguments["tag"], **kwargs)
+
+        self.assertTrue(ret, "Tagging process failed (after iteration)!")
+
+    def test_09_processor_iter(self):
+        options = None
+        with open(self._arguments["config"], "r") as f:
+            options = yaml.load(f)
+
+        config = UnitexConfig()
+        config.load(options)
+
+        index = self._arguments["ind"]
+        if config["virtualization"] is True:
+            index = "%s%s" % (UnitexConstants.VFS_PREFIX, index)
+
+        with UnitexProcessor(config) as processor:
+            processor.open(self._arguments["txt"], mode="srtlf", tagged=False)
+
+            # The 'ignore' mode has its own match builder, the 'merge' and
+            # 'replace' modes share the other one.
+            for output_mode in (UnitexConstants.OUTPUT_MODE_MERGE,
+                                UnitexConstants.OUTPUT_MODE_REPLACE,
+                                UnitexConstants.OUTPUT_MODE_IGNORE):
+                matches = list(processor.iter(self._arguments["fst2"], output_mode=output_mode))
+
+                f = UnitexFile()
+                f.open(index, "r")
+                lines = f.read().splitlines()
+                f.close()
+
+                # The first line is the index header.
+                expected = []
+                for line in lines[1:]:
+                    line = line.rstrip()
+                    if not line:
+                        continue
+                    parts = line.split(" ", 2)
+                    expected.append({"offsets": (parts[0], parts[1]),
+                                     "match": parts[2] if len(parts) == 3 else ""})
+
+                self.assertTrue(matches, "No match found (%s mode)!" % output_mode)
+                self.assertEqual(matches, expected, "Wrong matches (%s mode)!" % output_mode)
+
+                if output_mode == UnitexConstants.OUTPUT_MODE_IGNORE:
+                    for match in matches:
+                        self.assertEqual(match["match"], "", "Output not ignored!")
+                else:
+                    for match in matches:
+                        self.assertTrue("<FACT>" in match["match"], "Output not found (%s mode)!" % output_mode)
+
 
 if __name__ == '__main__':
     unittest.main()
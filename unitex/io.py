@@ -5,6 +5,8 @@ from __future__ import unicode_literals
 
 import logging
 import os
+import threading
+import time
 
 import _unitex
 
@@ -12,6 +14,69 @@ from unitex import *
 
 _LOGGER = logging.getLogger(__name__)
 
+# Virtual directory listings are kept in memory during LS_CACHE_TTL
+# seconds (0 disables the cache). The functions of this module
+# invalidate the cache by themselves but any other modification of the
+# virtual filesystem (i.e. the Unitex tools) requires a call to the
+# 'clear_ls_cache' function.
+LS_CACHE_TTL = 2.0
+
+# Directory path -> (timestamp, files (ordered), files (set))
+_LS_CACHE = {}
+
+# The Unitex tools run without the GIL: the listings are done outside of
+# the lock and only stored if the cache wasn't invalidated meanwhile
+# (i.e. the generation is unchanged).
+_LS_LOCK = threading.Lock()
+_LS_GENERATION = 0
+
+
+
+def _cached_ls(path):
+    now = time.time()
+
+    with _LS_LOCK:
+        entry = _LS_CACHE.get(path)
+        if entry is not None and (now - entry[0]) <= LS_CACHE_TTL:
+            return entry
+        generation = _LS_GENERATION
+
+    files = _unitex.unitex_ls(path)
+    entry = (now, tuple(files), frozenset(files))
+
+    with _LS_LOCK:
+        if generation == _LS_GENERATION:
+            _LS_CACHE[path] = entry
+
+    return entry
+
+def _invalidate(path):
+    global _LS_GENERATION
+
+    with _LS_LOCK:
+        _LS_GENERATION += 1
+
+        # The virtual listings are prefix based: a file may appear in
+        # the listing of any of its parent directories.
+        for directory in list(_LS_CACHE.keys()):
+            if path.startswith(directory):
+                del _LS_CACHE[directory]
+
+def clear_ls_cache():
+    """
+    This function clears the virtual directory listings cache used by
+    the 'ls' and 'exists' functions.
+
+    *No argument.*
+
+    *No return.*
+    """
+    global _LS_GENERATION
+
+    with _LS_LOCK:
+        _LS_GENERATION += 1
+        _LS_CACHE.clear()
+
 
 
 def cp(source_path, target_path):
@@ -29,10 +94,11 @@ def cp(source_path, target_path):
 
       **True** if it succeeds, **False** otherwise.
     """
-    _LOGGER.info("Copying file '%s' to '%s'..." % (source_path, target_path))
+    _LOGGER.info("Copying file '%s' to '%s'...", source_path, target_path)
     ret = _unitex.unitex_cp(source_path, target_path)
+    _invalidate(target_path)
     if ret is False:
-        _LOGGER.info("[FAILED!]")
+        _LOGGER.warning("[FAILED!] Copying file '%s' to '%s'", source_path, target_path)
 
     return ret
 
@@ -49,10 +115,35 @@ def rm(path):
 
       **True** if it succeeds, **False** otherwise.
     """
-    _LOGGER.info("Removing file '%s'..." % path)
+    _LOGGER.debug("Removing file '%s'...", path)
     ret = _unitex.unitex_rm(path)
+    _invalidate(path)
     if ret is False:
-        _LOGGER.info("[FAILED!]")
+        _LOGGER.warning("[FAILED!] Removing file '%s'", path)
+
+    return ret
+
+def rm_many(paths):
+    """
+    This function removes a list of files in a single call to the
+    Unitex library. The pathes can be on the virtual filesystem or the
+    disk filesystem.
+
+    *Argument:*
+
+    - **paths [list(str)]** -- file pathes
+
+    *Return [list(bool)]:*
+
+      For each path, **True** if the removal succeeds, **False**
+      otherwise.
+    """
+    _LOGGER.info("Removing %s files...", len(paths))
+    ret = _unitex.unitex_rm_many(paths)
+    for path in paths:
+        _invalidate(path)
+    if False in ret:
+        _LOGGER.warning("[FAILED!] Removing %s files", ret.count(False))
 
     return ret
 
@@ -70,10 +161,12 @@ def mv(old_path, new_path):
 
       **True** if it succeeds, **False** otherwise.
     """
-    _LOGGER.info("Moving file '%s' to '%s'..." % (old_path, new_path))
+    _LOGGER.info("Moving file '%s' to '%s'...", old_path, new_path)
     ret = _unitex.unitex_mv(old_path, new_path)
+    _invalidate(old_path)
+    _invalidate(new_path)
     if ret is False:
-        _LOGGER.info("[FAILED!]")
+        _LOGGER.warning("[FAILED!] Moving file '%s' to '%s'", old_path, new_path)
 
     return ret
 
@@ -89,10 +182,11 @@ def mkdir(path):
 
       **True** if it succeeds, **False** otherwise.
     """
-    _LOGGER.info("Creating directory '%s'..." % path)
+    _LOGGER.info("Creating directory '%s'...", path)
     ret = _unitex.unitex_mkdir(path)
+    _invalidate(path)
     if ret is False:
-        _LOGGER.info("[FAILED!]")
+        _LOGGER.warning("[FAILED!] Creating directory '%s'", path)
 
     return ret
 
@@ -108,10 +202,11 @@ def rmdir(path):
 
       **True** if it succeeds, **False** otherwise.
     """
-    _LOGGER.info("Removing directory '%s'..." % path)
+    _LOGGER.info("Removing directory '%s'...", path)
     ret = _unitex.unitex_rmdir(path)
+    _invalidate(path)
     if ret is False:
-        _LOGGER.info("[FAILED!]")
+        _LOGGER.warning("[FAILED!] Removing directory '%s'", path)
 
     return ret
 
@@ -128,8 +223,10 @@ def ls(path):
       The function returns a list of files (not directories) if the
       directory is not empty and an empty list otherwise.
     """
-    _LOGGER.info("Listing directory '%s'..." % path)
-    return _unitex.unitex_ls(path)
+    _LOGGER.info("Listing directory '%s'...", path)
+    if LS_CACHE_TTL <= 0 or path.startswith(UnitexConstants.VFS_PREFIX) is False:
+        return _unitex.unitex_ls(path)
+    return list(_cached_ls(path)[1])
 
 def exists(path):
     """
@@ -146,7 +243,18 @@ def exists(path):
     """
     if path.startswith(UnitexConstants.VFS_PREFIX) is False:
         return os.path.exists(path)
-    return path in ls(path)
+    if LS_CACHE_TTL <= 0:
+        return path in ls(path)
+
+    # The parent directory listing is shared by all its files, which
+    # makes repeated checks (positive or negative) free until the cache
+    # expires or is invalidated.
+    directory = os.path.dirname(path)
+    if directory:
+        directory = os.path.join(directory, "")
+    else:
+        directory = UnitexConstants.VFS_PREFIX
+    return path in _cached_ls(directory)[2]
 
 
 
@@ -161,11 +269,13 @@ class UnitexFile(object):
     strings.**
     """
 
+    __slots__ = ("_use_bom", "_path", "_mode")
+
     def __init__(self):
-        self.__use_bom = None
+        self._use_bom = None
 
-        self.__path = None
-        self.__mode = None
+        self._path = None
+        self._mode = None
 
     def open(self, file, mode=None, use_bom=False):
         """
@@ -192,25 +302,25 @@ class UnitexFile(object):
         *No return.*
         """
 
-        if self.__path is not None:
-            raise UnitexException("You must close the current file (%s) before open another one..." % self.__path)
-        self.__use_bom = use_bom
+        if self._path is not None:
+            raise UnitexException("You must close the current file (%s) before open another one..." % self._path)
+        self._use_bom = use_bom
 
-        self.__path = file
+        self._path = file
 
         if mode is None:
             mode = "r"
-        self.__mode = mode
+        self._mode = mode
 
     def close(self):
         """
         This function close the opened file and reset all the internal
         parameters.
         """
-        if self.__path is None:
+        if self._path is None:
             raise UnitexException("There is no file to close...")
-        self.__path = None
-        self.__mode = None
+        self._path = None
+        self._mode = None
 
     def write(self, data):
         """
@@ -223,16 +333,17 @@ class UnitexFile(object):
 
         *No return.*
         """
-        if self.__path is None:
+        if self._path is None:
             raise UnitexException("You must open a file before writing...")
-        if self.__mode not in ("w", "a"):
-            raise UnitexException("File '%s' is opened in read mode..." % self.__path)
+        if self._mode not in ("w", "a"):
+            raise UnitexException("File '%s' is opened in read mode..." % self._path)
 
-        if self.__mode == "w":
-            bom = 1 if self.__use_bom is True else 0
-            _unitex.unitex_write_file(self.__path, data, bom)
+        if self._mode == "w":
+            bom = 1 if self._use_bom is True else 0
+            _unitex.unitex_write_file(self._path, data, bom)
         else:
-            _unitex.unitex_append_to_file(self.__path, data)
+            _unitex.unitex_append_to_file(self._path, data)
+        _invalidate(self._path)
 
     def read(self):
         """
@@ -245,12 +356,37 @@ class UnitexFile(object):
 
           The data read are returned as a unicode string.
         """
-        if self.__path is None:
+        if self._path is None:
             raise UnitexException("You must open a file before reading...")
-        if self.__mode not in ["r", "b"]:
-            raise UnitexException("File '%s' is opened in write/append mode..." % self.__path)
+        if self._mode not in ["r", "b"]:
+            raise UnitexException("File '%s' is opened in write/append mode..." % self._path)
 
-        if self.__mode == "r":
-            return _unitex.unitex_read_file(self.__path)
-        elif self.__mode == "b":
-            return _unitex.unitex_read_binary_file(self.__path)
+        if self._mode == "r":
+            return _unitex.unitex_read_file(self._path)
+        elif self._mode == "b":
+            return _unitex.unitex_read_binary_file(self._path)
+
+    def __iter__(self):
+        """
+        This function iterates over the lines of the opened file without
+        loading its whole content in memory. The file must be opened in
+        'r' mode.
+
+        *Return [iterator(unicode)]:*
+
+          The lines (including the end of line character) are returned
+          as unicode strings.
+        """
+        if self._path is None:
+            raise UnitexException("You must open a file before reading...")
+        if self._mode != "r":
+            raise UnitexException("File '%s' is not opened in read mode..." % self._path)
+
+        handle = _unitex.unitex_open_read(self._path)
+        try:
+            line = _unitex.unitex_readline(handle)
+            while line is not None:
+                yield line
+                line = _unitex.unitex_readline(handle)
+        finally:
+            _unitex.unitex_close_read(handle)
@@ -5,13 +5,11 @@ from __future__ import absolute_import, unicode_literals
 
 import logging
 import os
-import re
+import threading
 
 # Compatibility Python 2/3
 from io import open
 
-from xml.sax.saxutils import escape
-
 from unitex import *
 from unitex.io import *
 from unitex.resources import *
@@ -22,13 +20,95 @@ _LOGGER = logging.getLogger(__name__)
 
 
 
-RULES = []
-RULES.append((re.compile(r"&"), "&amp;"))
+_VFS = UnitexConstants.VFS_PREFIX
+
+def _vfs(path):
+    return _VFS + path
+
+def _mtime(path):
+    # The virtual files have no modification time.
+    if path.startswith(_VFS) is True:
+        return None
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+
+# The persisted resources are shared by all the processors of the
+# process and reference counted. There is a single live entry per
+# resource (type, absolute path) which stores the persisted object, its
+# reference count and the file modification time at load time. The
+# persisted objects are mapped back to their entry key in order to
+# share a configuration already loaded by another processor.
+_PERSIST_CACHE = {}
+_PERSIST_KEYS = {}
+_PERSIST_LOCK = threading.Lock()
+
+def _memo(_type):
+    def decorator(loader):
+        def load(path):
+            with _PERSIST_LOCK:
+                key = _PERSIST_KEYS.get((_type, path))
+                if key is None:
+                    if path.startswith(_VFS) is False:
+                        path = os.path.abspath(path)
+                    key = (_type, path)
+
+                entry = _PERSIST_CACHE.get(key)
+                if entry is None:
+                    _object = loader(key[1])
+                    entry = [_object, 0, _mtime(key[1])]
+
+                    _PERSIST_CACHE[key] = entry
+                    _PERSIST_KEYS[(_type, _object)] = key
+                elif entry[2] != _mtime(key[1]):
+                    # The persisted object may have the name of the
+                    # resource file: it can't be reloaded while it is
+                    # used by another processor.
+                    _LOGGER.warning("Resource '%s' modified while persisted. The loaded version is kept until released.", key[1])
+                entry[1] += 1
+
+                return entry[0]
+        return load
+    return decorator
+
+def _release(_type, _object, free):
+    with _PERSIST_LOCK:
+        key = _PERSIST_KEYS.get((_type, _object))
+        if key is not None:
+            entry = _PERSIST_CACHE[key]
+
+            entry[1] -= 1
+            if entry[1] > 0:
+                return
+
+            del _PERSIST_CACHE[key]
+            del _PERSIST_KEYS[(_type, _object)]
+
+        free(_object)
+
+_load_persistent_alphabet = _memo(UnitexConstants.RESOURCE_ALPHABET)(load_persistent_alphabet)
+_load_persistent_fst2 = _memo(UnitexConstants.RESOURCE_GRAMMAR)(load_persistent_fst2)
+_load_persistent_dictionary = _memo(UnitexConstants.RESOURCE_DICTIONARY)(load_persistent_dictionary)
+
+
+
+def _working_files(path):
+    # The working files (.snt file and *_snt directory) are named after
+    # the text file name without its extension.
+    directory, filename = os.path.split(path)
+    name, extension = os.path.splitext(filename)
+
+    return os.path.join(directory, "%s.snt" % name), os.path.join(directory, "%s_snt" % name)
+
+
 
 def escape(sequence):
-    for pattern, substitute in RULES:
-        sequence = pattern.sub(substitute, sequence)
-    return sequence
+    # Only the ampersands are escaped: the tagged text contains the XML
+    # markup produced by the grammar outputs.
+    return sequence.replace("&", "&amp;")
 
 
 
@@ -47,58 +127,107 @@ class UnitexProcessor(object):
         self.__snt = None
         self.__dir = None
 
+        self.__concord_ind = None
+        self.__concord_txt = None
+        self.__concord_merge = None
+        self.__text_tfst = None
+        self.__text_tind = None
+
+        self.__fst = None
+
+        # The index file read by an 'iter' generator (which must not be
+        # rewritten or removed until the generator is exhausted or
+        # closed).
+        self.__stream = None
+
         verbose = self.__config["verbose"]
         debug = self.__config["debug"]
         log = self.__config["log"]
 
         init_log_system(verbose, debug, log)
 
+        # The 'locate' and 'concord' options which only depend on the
+        # configuration are set once for all the calls.
+        self.__locate_kwargs = {}
+        self.__locate_kwargs["morpho"] = self.__config["tools"]["locate"]["morpho"]
+        self.__locate_kwargs["start_on_space"] = self.__config["tools"]["locate"]["start_on_space"]
+        self.__locate_kwargs["char_by_char"] = self.__config["tools"]["locate"]["char_by_char"]
+        self.__locate_kwargs["korean"] = self.__config["tools"]["locate"]["korean"]
+        self.__locate_kwargs["arabic_rules"] = self.__config["tools"]["locate"]["arabic_rules"]
+        self.__locate_kwargs["negation_operator"] = self.__config["tools"]["locate"]["negation_operator"]
+        self.__locate_kwargs["stop_token_count"] = self.__config["tools"]["locate"]["stop_token_count"]
+        self.__locate_kwargs["protect_dic_chars"] = self.__config["tools"]["locate"]["protect_dic_chars"]
+        self.__locate_kwargs["variable"] = self.__config["tools"]["locate"]["variable"]
+        self.__locate_kwargs["variable_error"] = self.__config["tools"]["locate"]["variable_error"]
+
+        self.__locate_kwargs["sntdir"] = None
+        self.__locate_kwargs["number_of_matches"] = None
+        self.__locate_kwargs["ambiguous_outputs"] = False
+
+        self.__concord_kwargs = {}
+        self.__concord_kwargs["font"] = None
+        self.__concord_kwargs["fontsize"] = None
+        self.__concord_kwargs["only_ambiguous"] = False
+        self.__concord_kwargs["only_matches"] = False
+        self.__concord_kwargs["left"] = "0"
+        self.__concord_kwargs["right"] = "0"
+        self.__concord_kwargs["sort"] = UnitexConstants.SORT_TEXT_ORDER
+        self.__concord_kwargs["script"] = None
+        self.__concord_kwargs["offsets"] = None
+        self.__concord_kwargs["unxmlize"] = None
+        self.__concord_kwargs["directory"] = None
+        self.__concord_kwargs["thai"] = self.__config["tools"]["concord"]["thai"]
+
         self._load()
 
-    def __del__(self):
-        self._free()
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.__txt is not None:
+            self.close(clean=True, free=True)
+        else:
+            self._free()
 
     def _load(self):
         if self.__config["persistence"] is False:
             return
-        self.__persisted_objects = []
+        self.__persisted_objects = {}
+        self.__persisted_objects[UnitexConstants.RESOURCE_ALPHABET] = []
+        self.__persisted_objects[UnitexConstants.RESOURCE_GRAMMAR] = []
+        self.__persisted_objects[UnitexConstants.RESOURCE_DICTIONARY] = []
 
         if self.__config["resources"]["alphabet"] is not None:
-            _type = UnitexConstants.RESOURCE_ALPHABET
-            _object = load_persistent_alphabet(self.__config["resources"]["alphabet"])
+            _object = _load_persistent_alphabet(self.__config["resources"]["alphabet"])
 
-            self.__persisted_objects.append((_type, _object))
+            self.__persisted_objects[UnitexConstants.RESOURCE_ALPHABET].append(_object)
             self.__config["resources"]["alphabet"] = _object
 
         if self.__config["resources"]["alphabet-sorted"] is not None:
-            _type = UnitexConstants.RESOURCE_ALPHABET
-            _object = load_persistent_alphabet(self.__config["resources"]["alphabet-sorted"])
+            _object = _load_persistent_alphabet(self.__config["resources"]["alphabet-sorted"])
 
-            self.__persisted_objects.append((_type, _object))
+            self.__persisted_objects[UnitexConstants.RESOURCE_ALPHABET].append(_object)
             self.__config["resources"]["alphabet-sorted"] = _object
 
         if self.__config["resources"]["sentence"] is not None:
-            _type = UnitexConstants.RESOURCE_GRAMMAR
-            _object = load_persistent_fst2(self.__config["resources"]["sentence"])
+            _object = _load_persistent_fst2(self.__config["resources"]["sentence"])
 
-            self.__persisted_objects.append((_type, _object))
+            self.__persisted_objects[UnitexConstants.RESOURCE_GRAMMAR].append(_object)
             self.__config["resources"]["sentence"] = _object
 
         if self.__config["resources"]["replace"] is not None:
-            _type = UnitexConstants.RESOURCE_GRAMMAR
-            _object = load_persistent_fst2(self.__config["resources"]["replace"])
+            _object = _load_persistent_fst2(self.__config["resources"]["replace"])
 
-            self.__persisted_objects.append((_type, _object))
+            self.__persisted_objects[UnitexConstants.RESOURCE_GRAMMAR].append(_object)
             self.__config["resources"]["replace"] = _object
 
         if self.__config["resources"]["dictionaries"] is not None:
             _objects = []
 
-            _type = UnitexConstants.RESOURCE_DICTIONARY
             for dictionary in self.__config["resources"]["dictionaries"]:
-                _object = load_persistent_dictionary(dictionary)
+                _object = _load_persistent_dictionary(dictionary)
 
-                self.__persisted_objects.append((_type, _object))
+                self.__persisted_objects[UnitexConstants.RESOURCE_DICTIONARY].append(_object)
                 _objects.append(_object)
 
             self.__config["resources"]["dictionaries"] = _objects
@@ -107,25 +236,30 @@ class UnitexProcessor(object):
         if self.__persisted_objects is None:
             return
 
-        for _type, _object in self.__persisted_objects:
-            if _type == UnitexConstants.RESOURCE_GRAMMAR:
-                free_persistent_fst2(_object)
-            elif _type == UnitexConstants.RESOURCE_DICTIONARY:
-                free_persistent_dictionary(_object)
-            elif _type == UnitexConstants.RESOURCE_ALPHABET:
-                free_persistent_alphabet(_object)
+        # The resources are only freed when released by their last
+        # processor.
+        for _object in self.__persisted_objects[UnitexConstants.RESOURCE_GRAMMAR]:
+            _release(UnitexConstants.RESOURCE_GRAMMAR, _object, free_persistent_fst2)
+        for _object in self.__persisted_objects[UnitexConstants.RESOURCE_DICTIONARY]:
+            _release(UnitexConstants.RESOURCE_DICTIONARY, _object, free_persistent_dictionary)
+        for _object in self.__persisted_objects[UnitexConstants.RESOURCE_ALPHABET]:
+            _release(UnitexConstants.RESOURCE_ALPHABET, _object, free_persistent_alphabet)
+
+        self.__persisted_objects = None
 
     def _clean(self):
         if self.__txt is None:
             _LOGGER.error("Unable to clean processor. No file opened!")
             return
+        if self.__stream is not None:
+            raise UnitexException("Unable to clean processor. The matches of '%s' are still iterated." % self.__stream)
 
         if self.__config["virtualization"] is True:
+            paths = []
             if self.__dir is not None:
-                for vf in ls("%s%s" % (UnitexConstants.VFS_PREFIX, self.__dir)):
-                    rm(vf)
-            rm(self.__snt)
-            rm(self.__txt)
+                paths = ls(_vfs(self.__dir))
+            paths += [self.__snt, self.__txt]
+            rm_many(paths)
         else:
             rm(self.__snt)
 
@@ -205,89 +339,49 @@ class UnitexProcessor(object):
         if alphabet is None:
             raise UnitexException("Unable to locate pattern. No alphabet file provided.")
 
-        kwargs = {}
-        kwargs["morpho"] = self.__config["tools"]["locate"]["morpho"]
-        kwargs["start_on_space"] = self.__config["tools"]["locate"]["start_on_space"]
-        kwargs["char_by_char"] = self.__config["tools"]["locate"]["char_by_char"]
-        kwargs["korean"] = self.__config["tools"]["locate"]["korean"]
-        kwargs["arabic_rules"] = self.__config["tools"]["locate"]["arabic_rules"]
-        kwargs["negation_operator"] = self.__config["tools"]["locate"]["negation_operator"]
-        kwargs["stop_token_count"] = self.__config["tools"]["locate"]["stop_token_count"]
-        kwargs["protect_dic_chars"] = self.__config["tools"]["locate"]["protect_dic_chars"]
-        kwargs["variable"] = self.__config["tools"]["locate"]["variable"]
-        kwargs["variable_error"] = self.__config["tools"]["locate"]["variable_error"]
-
-        kwargs["sntdir"] = None
-        kwargs["number_of_matches"] = None
-        kwargs["ambiguous_outputs"] = False
+        if self.__stream is not None:
+            raise UnitexException("Unable to locate pattern. The matches of '%s' are still iterated." % self.__stream)
 
         if match_mode not in (UnitexConstants.MATCH_MODE_LONGEST,
                               UnitexConstants.MATCH_MODE_SHORTEST):
             raise UnitexException("Wrong value for the 'match_mode' option. UnitexConstants.MATCH_MODE_X required.")
-        kwargs["match_mode"] = match_mode
 
         if output_mode not in (UnitexConstants.OUTPUT_MODE_IGNORE,
                                UnitexConstants.OUTPUT_MODE_MERGE,
                                UnitexConstants.OUTPUT_MODE_REPLACE):
             raise UnitexException("Wrong value for the 'output_mode' option. UnitexConstants.OUTPUT_MODE_X required.")
-        kwargs["output_mode"] = output_mode
+
+        kwargs = dict(self.__locate_kwargs, match_mode=match_mode, output_mode=output_mode)
 
         ret = locate(grammar, self.__snt, alphabet, **kwargs)
         if ret is False:
             raise UnitexException("Locate failed!")
 
-        index = os.path.join(self.__dir, "concord.ind")
-        if self.__config["virtualization"] is True:
-            index = "%s%s" % (UnitexConstants.VFS_PREFIX, index)
-
-        if exists(index) is False:
-            raise UnitexException("Locate failed! No index produced.")
-        return index
+        return self.__concord_ind
 
     def _concord(self, index, merge=False, output=None):
         alphabet = self.__config["resources"]["alphabet"]
         if alphabet is None:
             raise UnitexException("Unable to build concordance. No alphabet file provided.")
 
-        kwargs = {}
-        kwargs["font"] = None
-        kwargs["fontsize"] = None
-        kwargs["only_ambiguous"] = False
-        kwargs["left"] = "0"
-        kwargs["right"] = "0"
-        kwargs["sort"] = UnitexConstants.SORT_TEXT_ORDER
-        kwargs["script"] = None
-        kwargs["offsets"] = None
-        kwargs["unxmlize"] = None
-        kwargs["directory"] = None
-        kwargs["thai"] = self.__config["tools"]["concord"]["thai"]
-
         result = None
 
         if merge is True:
-            kwargs["format"] = UnitexConstants.FORMAT_MERGE
             if output is None:
                 raise UnitexException("You must provide the output file path to use the merge option.")
-            kwargs["output"] = output
-            kwargs["only_matches"] = False
+            kwargs = dict(self.__concord_kwargs, format=UnitexConstants.FORMAT_MERGE, output=output)
 
             result = output
 
         else:
-            kwargs["format"] = UnitexConstants.FORMAT_TEXT
-            kwargs["output"] = None
-            kwargs["only_matches"] = False
+            kwargs = dict(self.__concord_kwargs, format=UnitexConstants.FORMAT_TEXT, output=None)
 
-            result = os.path.join(self.__dir, "concord.txt")
-            if self.__config["virtualization"] is True:
-                result = "%s%s" % (UnitexConstants.VFS_PREFIX, result)
+            result = self.__concord_txt
 
         ret = concord(index, alphabet, **kwargs)
         if ret is False:
             raise UnitexException("Concord failed!")
 
-        if exists(result) is False:
-            raise UnitexException("Concord failed! No concordances produced.")
         return result
 
     def open(self, path, mode="srtl", tagged=False):
@@ -314,25 +408,56 @@ class UnitexProcessor(object):
           preprocessing options: sentence segmentation and Replace.fst2
           application.
 
+        **NOTE:** the persisted resources are not freed when the
+        processor is garbage collected. Use the processor as a context
+        manager (the opened text is closed and the resources freed at
+        the end of the 'with' block) or call the 'close' function with
+        free=True once all your corpus are processed::
+
+            with UnitexProcessor(config) as processor:
+                processor.open(path, mode="srtlf")
+                processor.tag(grammar, output)
+
         *No return.*
         """
-        directory, filename = os.path.split(path)
-        name, extension = os.path.splitext(filename)
-
         self.__txt = path
-        self.__snt = os.path.join(directory, "%s.snt" % name)
-        self.__dir = os.path.join(directory, "%s_snt" % name)
+        self.__snt, self.__dir = _working_files(path)
 
         if self.__config["virtualization"] is True:
-            txt = "%s%s" % (UnitexConstants.VFS_PREFIX, self.__txt)
+            # The Unitex library can't expose a disk file under a virtual
+            # name and Normalize writes the .snt file next to its input:
+            # the text must be copied to keep all the working files on
+            # the virtual filesystem.
+            txt = _vfs(self.__txt)
             cp(self.__txt, txt)
 
             self.__txt = txt
-            self.__snt = "%s%s" % (UnitexConstants.VFS_PREFIX, self.__snt)
+            self.__snt = _vfs(self.__snt)
+
+        # The working files pathes are fixed until the processor is
+        # closed.
+        self.__concord_ind = os.path.join(self.__dir, "concord.ind")
+        self.__concord_txt = os.path.join(self.__dir, "concord.txt")
+        self.__concord_merge = os.path.join(self.__dir, "concord-merge-temp.txt")
+        self.__text_tfst = os.path.join(self.__dir, "text.tfst")
+        self.__text_tind = os.path.join(self.__dir, "text.tind")
+
+        if self.__config["virtualization"] is True:
+            self.__concord_ind = _vfs(self.__concord_ind)
+            self.__concord_txt = _vfs(self.__concord_txt)
+            self.__concord_merge = _vfs(self.__concord_merge)
+            self.__text_tfst = _vfs(self.__text_tfst)
+            self.__text_tind = _vfs(self.__text_tind)
+
+        # The text automaton is built (once) on demand by 'tofst'.
+        self.__fst = None
 
         if os.path.exists(self.__dir) is False:
             mkdir(self.__dir)
 
+        # Each step is a distinct Unitex tool working on the .snt file.
+        # With virtualization, the intermediate versions of this file
+        # stay in memory (virtual filesystem).
         self._normalize()
 
         if tagged is False:
@@ -346,6 +471,69 @@ class UnitexProcessor(object):
         if "l" in mode:
             self._lexicalize()
 
+    def open_many(self, paths, mode="srtl", tagged=False, max_workers=None):
+        """
+        This function opens several texts concurrently. Each text is
+        opened by a new processor which shares the configuration and the
+        persisted resources of the current one. The preprocessing
+        operations are run in a thread pool (the Unitex tools release
+        the GIL).
+        **WARNING: this function requires the 'concurrent.futures'
+        module (i.e. the 'futures' package for Python 2).**
+
+        *Arguments:*
+
+        - **paths [list(str)]** -- the input corpus file pathes. The
+          texts must not share their working files (i.e. a same path
+          or a same file name with different extensions).
+
+        - **mode [str]** -- the pre-processing operations applied on
+          each text (cf. the 'open' function).
+
+        - **tagged [bool]** -- this parameter specifies if the input
+          texts are tagged or not (cf. the 'open' function).
+
+        - **max_workers [int]** -- the maximum number of texts opened at
+          the same time (default: the 'ThreadPoolExecutor' default).
+
+        *Return [list(UnitexProcessor)]:*
+
+          The function returns the opened processors, in the order of
+          the input pathes. Each processor must be closed with the
+          'close' function (with free=True to release its reference on
+          the persisted resources).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # The texts sharing their working files (i.e. same path or same
+        # name with another extension) can't be opened at the same time.
+        working_files = set()
+        for path in paths:
+            files = _working_files(os.path.abspath(path))
+            if files in working_files:
+                raise UnitexException("Unable to open '%s'. Its working files (%s, %s) are shared with another text." % ((path,) + files))
+            working_files.add(files)
+
+        processors = [self.__class__(self.__config) for path in paths]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for processor, path in zip(processors, paths):
+                futures.append(executor.submit(processor.open, path, mode, tagged))
+
+        errors = [future.exception() for future in futures if future.exception() is not None]
+        if errors:
+            # A failed 'open' may have already created the working files
+            # (text copy, .snt file, *_snt directory).
+            for processor in processors:
+                if processor.__txt is not None:
+                    processor.close(clean=True, free=True)
+                else:
+                    processor._free()
+            raise errors[0]
+
+        return processors
+
     def close(self, clean=True, free=False):
         """
         This function resets all the internal parameters used by the
@@ -377,6 +565,14 @@ class UnitexProcessor(object):
         self.__snt = None
         self.__dir = None
 
+        self.__concord_ind = None
+        self.__concord_txt = None
+        self.__concord_merge = None
+        self.__text_tfst = None
+        self.__text_tind = None
+
+        self.__fst = None
+
     def tofst(self):
         """
         This function build the text automaton.
@@ -386,7 +582,14 @@ class UnitexProcessor(object):
         WARNING: The function returns a TextFST object. The object uses
         the text.tfst and text.tind files which are cleaned (i.e. erased)
         when the processor is closed.
+
+        NOTE: the automaton is built once per opened text. The following
+        calls return the same TextFST object until the processor is
+        closed or another text is opened.
         """
+        if self.__fst is not None:
+            return self.__fst
+
         kwargs = self.__config["tools"]["normalize"]
 
         alphabet = self.__config["resources"]["alphabet"]
@@ -408,16 +611,10 @@ class UnitexProcessor(object):
 #            _tind = "%s%s" % (UnitexConstants.VFS_PREFIX, tind)
 #            mv(_tind, tind)
 
-        tfst = os.path.join(self.__dir, "text.tfst")
-        if self.__config["virtualization"] is True:
-            tfst = "%s%s" % (UnitexConstants.VFS_PREFIX, tfst)
-
-        tind = os.path.join(self.__dir, "text.tind")
-        if self.__config["virtualization"] is True:
-            tind = "%s%s" % (UnitexConstants.VFS_PREFIX, tind)
-
         fst = TextFST()
-        fst.load(tfst, tind, "utf-8")
+        fst.load(self.__text_tfst, self.__text_tind, "utf-8")
+
+        self.__fst = fst
 
         return fst
 
@@ -443,6 +640,10 @@ class UnitexProcessor(object):
         *Return [iterator(str)]:*
 
           The function returns an iterator over the grammar matches.
+
+        NOTE: the matches are read lazily from the index file. Until the
+        iterator is exhausted (or closed), the processor can't locate
+        another grammar ('iter' or 'tag') nor be cleaned.
         """
         match_mode = kwargs.get("match_mode", UnitexConstants.MATCH_MODE_LONGEST)
         if match_mode not in (UnitexConstants.MATCH_MODE_LONGEST, UnitexConstants.MATCH_MODE_SHORTEST):
@@ -452,28 +653,46 @@ class UnitexProcessor(object):
         if output_mode not in (UnitexConstants.OUTPUT_MODE_MERGE, UnitexConstants.OUTPUT_MODE_IGNORE, UnitexConstants.OUTPUT_MODE_REPLACE):
             raise UnitexException("Invalid output mode '%s'...")
 
+        # The output mode is fixed for the whole index: the match builder
+        # is selected once, outside of the loop.
+        if output_mode == UnitexConstants.OUTPUT_MODE_IGNORE:
+            def build(parts):
+                return {"offsets": (parts[0], parts[1]), "match": ""}
+        else:
+            def build(parts):
+                match = parts[2] if len(parts) == 3 else ""
+                return {"offsets": (parts[0], parts[1]), "match": match}
+
         index = self._locate(grammar, match_mode, output_mode)
 
         matches = UnitexFile()
         matches.open(index, "r")
-        content = matches.read()
-        matches.close()
 
-        ind = re.compile(r"([^\s]+) ([^\s]+)(?: (.*))?")
+        # The index is read lazily: it is locked until the generator is
+        # exhausted or closed.
+        self.__stream = index
+
+        try:
+            lines = iter(matches)
 
-        lines = content.split("\n")
-        for line in lines[1:]:
-            line = line.rstrip()
-            if not line:
-                continue
+            # The first line is the index header.
+            next(lines, None)
 
-            match = ind.search(line)
+            for line in lines:
+                line = line.rstrip()
+                if not line:
+                    continue
 
-            groups = match.groups()
-            if output_mode == UnitexConstants.OUTPUT_MODE_IGNORE:
-                yield {"offsets": (groups[0], groups[1]), "match": ""}
-            else:
-                yield {"offsets": (groups[0], groups[1]), "match": groups[2]}
+                # Index line format: 'start end [output]'
+                parts = line.split(" ", 2)
+                if len(parts) < 2:
+                    raise UnitexException("Index file '%s' is corrupted ..." % index)
+
+                yield build(parts)
+        finally:
+            matches.close()
+
+            self.__stream = None
 
     def tag(self, grammar, output, **kwargs):
         """
@@ -510,30 +729,24 @@ class UnitexProcessor(object):
 
         if xml is False:
             self._concord(index, merge=True, output=output)
-            if exists(output) is False:
-                raise UnitexException("No tagged file produced!")
             return True
 
-        _output = os.path.join(self.__dir, "concord-merge-temp.txt")
-        if self.__config["virtualization"] is True:
-            _output = "%s%s" % (UnitexConstants.VFS_PREFIX, _output)
+        _output = self.__concord_merge
 
         self._concord(index, merge=True, output=_output)
-        if exists(_output) is False:
-            raise UnitexException("No (temporary) tagged file produced!")
 
-        tagged = open(output, "w", encoding="utf-8")
+        tagged = open(output, "w", encoding="utf-8", buffering=1<<20)
         tagged.write(u"<?xml version='1.0' encoding='UTF-8'?>\n")
         tagged.write(u"<TAGFILE query='%s'>\n" % grammar)
 
+        # The merged file is escaped line by line to avoid keeping
+        # (several copies of) the whole tagged text in memory.
         merged = UnitexFile()
         merged.open(_output, "r")
-        content = merged.read()
+        for line in merged:
+            tagged.write(escape(line))
         merged.close()
 
-        content = escape(content)
-        tagged.write(content)
-
         tagged.write(u"</TAGFILE>\n")
         tagged.close()
         rm(_output)
@@ -22,7 +22,7 @@ from unitex.config import CheckDicOptions,\
                           SortTxtOptions,\
                           TokenizeOptions,\
                           Txt2TFstOptions
-from unitex.io import exists
+from unitex.io import clear_ls_cache, exists
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +84,7 @@ def check_dic(dictionary, dtype, alphabet, **kwargs):
     _LOGGER.info("Checking dic '%s'" % dictionary)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -159,6 +160,7 @@ def compress(dictionary, **kwargs):
     _LOGGER.info("Compressing dic '%s'" % dictionary)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -410,6 +412,7 @@ def concord(index, alphabet, **kwargs):
     _LOGGER.info("Create concordance for '%s'" % index)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -503,6 +506,7 @@ def dico(dictionaries, text, alphabet, **kwargs):
     _LOGGER.info("Applying dictionaries")
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -559,6 +563,7 @@ def extract(text, output, index, **kwargs):
     _LOGGER.info("Extracting sentences")
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -637,6 +642,7 @@ def fst2txt(grammar, text, alphabet, **kwargs):
     _LOGGER.info("Applying grammar '%s'..." % grammar)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -739,6 +745,7 @@ def grf2fst2(grammar, alphabet, **kwargs):
     _LOGGER.info("Compiling grammar '%s'..." % grammar)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -935,6 +942,7 @@ def locate(grammar, text, alphabet, **kwargs):
     _LOGGER.info("Locating pattern '%s'..." % grammar)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -1015,6 +1023,7 @@ def normalize(text, **kwargs):
     _LOGGER.info("Normalizing text '%s'..." % text)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -1089,6 +1098,7 @@ def sort_txt(text, **kwargs):
     _LOGGER.info("Sorting file '%s'..." % text)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -1187,6 +1197,7 @@ def tokenize(text, alphabet, **kwargs):
     _LOGGER.info("Tokenizing file '%s'..." % text)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret
 
@@ -1258,5 +1269,6 @@ def txt2tfst(text, alphabet, **kwargs):
     _LOGGER.info("Building text automaton for '%s'..." % text)
     _LOGGER.debug("Command: %s", command)
     ret = _unitex.unitex_tool(command)
+    clear_ls_cache()
 
     return ret